@@ -9,6 +9,12 @@ from .model import ModelRun
 
 logging.basicConfig(level=logging.INFO)
 
+# Use the libyaml parser when pyyaml is built with it
+try:
+    from yaml import CLoader as Loader
+except ImportError:
+    from yaml import Loader
+
 installed = []
 try:
     from rompy.core import BaseConfig
@@ -40,7 +46,7 @@ def main(model, config, kwargs):
         model(str): model type
         config(str): yaml config file
     """
-    args = yaml.load(config, Loader=yaml.Loader)
+    args = yaml.load(config, Loader=Loader)
 
     kw = {}
     for item in kwargs:
@@ -1,4 +1,27 @@
-from .boundary import Boundnest1
-from .config import SwanConfig
-from .data import SwanDataGrid
-from .grid import SwanGrid
+"""SWAN model interface.
+
+Public objects are imported on first attribute access (PEP 562) so that importing
+a single SWAN submodule such as `rompy.swan.components.output` does not pull in
+the full configuration stack.
+
+"""
+import importlib
+
+_LAZY_IMPORTS = {
+    "Boundnest1": "rompy.swan.boundary",
+    "SwanConfig": "rompy.swan.config",
+    "SwanDataGrid": "rompy.swan.data",
+    "SwanGrid": "rompy.swan.grid",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
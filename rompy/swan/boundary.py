@@ -1,10 +1,9 @@
 """SWAN boundary classes."""
 import logging
 from pathlib import Path
-from typing import Literal, Optional, Union
+from typing import Literal, Optional
 
-import numpy as np
-from pydantic import Field, model_validator
+from pydantic import Field
 
 from rompy.core.time import TimeRange
 from rompy.core.boundary import BoundaryWaveStation
@@ -1,2 +1,33 @@
-from rompy.swan.components import cgrid
-from rompy.swan.components import inpgrid
+"""SWAN components.
+
+Submodules are imported on first attribute access (PEP 562) so that importing a
+single component module does not build the pydantic schemas of all the others.
+
+"""
+import importlib
+
+_SUBMODULES = (
+    "base",
+    "boundary",
+    "cgrid",
+    "group",
+    "inpgrid",
+    "lockup",
+    "numerics",
+    "output",
+    "physics",
+    "startup",
+)
+
+# Only the submodules the package imported eagerly before it became lazy.
+__all__ = ["cgrid", "inpgrid"]
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,6 +1,6 @@
 """Computational grid for SWAN."""
 import logging
-from pydantic import Field, model_validator
+from pydantic import Field, field_validator, model_validator
 from typing import Literal, Optional
 from abc import ABC, abstractmethod
 
@@ -69,13 +69,14 @@ class REGULAR(CGRID):
     )
     grid: GRIDREGULAR = Field(description="Computational grid definition")
 
-    @model_validator(mode="after")
-    def grid_suffix(self) -> "REGULAR":
+    @field_validator("grid")
+    @classmethod
+    def grid_suffix(cls, grid: GRIDREGULAR) -> GRIDREGULAR:
         """Set expected grid suffix."""
-        if self.grid.suffix != "c":
-            logger.debug(f"Set grid suffix 'c' instead of {self.grid.suffix}")
-            self.grid.suffix = "c"
-        return self
+        if grid.suffix != "c":
+            logger.debug(f"Set grid suffix 'c' instead of {grid.suffix}")
+            grid.suffix = "c"
+        return grid
 
     def cmd(self) -> str:
         repr = f"CGRID REGULAR {self.grid.render()} {self.spectrum.render()}"
@@ -1,6 +1,6 @@
 """SWAN group components."""
 import logging
-from typing import Annotated, Literal, Optional, Union, Any
+from typing import Annotated, ClassVar, Literal, Optional, Union
 from pydantic import Field, model_validator, field_validator
 
 from rompy.swan.types import PhysicsOff
@@ -45,7 +45,6 @@ from rompy.swan.components.physics import (
     DIFFRACTION,
     SURFBEAT,
     SCAT,
-    OFF,
     OFFS,
 )
 from rompy.swan.components.output import (
@@ -88,10 +87,8 @@ class BaseGroupComponent(BaseComponent):
 
     def render(self, *args, **kwargs) -> str:
         """Override base class to allow rendering list of components."""
-        cmds = []
-        for cmd in self.cmd():
-            cmds.append(super().render(cmd))
-        return "\n\n".join(cmds)
+        render = super().render
+        return "\n\n".join([render(cmd) for cmd in self.cmd()])
 
 
 # =====================================================================================
@@ -246,10 +243,7 @@ class INPGRIDS(BaseGroupComponent):
         return inpgrids
 
     def cmd(self) -> str | list:
-        repr = []
-        for inpgrid in self.inpgrids:
-            repr += [inpgrid.cmd()]
-        return repr
+        return [inpgrid.cmd() for inpgrid in self.inpgrids]
 
 
 # =====================================================================================
@@ -540,6 +534,22 @@ class OUTPUT(BaseGroupComponent):
     test: Optional[TEST_TYPE] = Field(default=None)
     _location_fields: list = ["frame", "group", "curve", "isoline", "points", "ngrid"]
     _write_fields: list = ["block", "table", "specout", "nestout"]
+    _cmd_fields: ClassVar[tuple] = (
+        "frame",
+        "group",
+        "curve",
+        "ray",
+        "isoline",
+        "points",
+        "ngrid",
+        "quantity",
+        "output_options",
+        "block",
+        "table",
+        "specout",
+        "nestout",
+        "test",
+    )
 
     @model_validator(mode="after")
     def write_locations_exists(self) -> "OUTPUT":
@@ -580,8 +590,8 @@ class OUTPUT(BaseGroupComponent):
             if sname in ["BOTTGRID", "COMPGRID"]:
                 return self
             location = self._filter_location(sname)
-            component = location.model_type.upper().split("_")[0]
-            if component not in ["FRAME", "GROUP"]:
+            if not isinstance(location, (FRAME, GROUP)):
+                component = location.model_type.upper().split("_")[0]
                 raise ValueError(
                     f"Block sname='{sname}' specified with {component} Location "
                     "component but only only FRAME or GROUP components are supported"
@@ -660,36 +670,22 @@ class OUTPUT(BaseGroupComponent):
         raise ValueError(f"Location component with sname='{sname}' not found")
 
     def cmd(self) -> list:
-        """Command file string for this component."""
+        """Command file strings for this component.
+
+        A list is returned rather than a joined string so that `render()` can split
+        and separate each command in the same way as the other group components.
+
+        """
         repr = []
-        if self.frame is not None:
-            repr += [f"{self.frame.cmd()}"]
-        if self.group is not None:
-            repr += [f"{self.group.cmd()}"]
-        if self.curve is not None:
-            repr += self.curve.cmd()  # Component renders a list
-        if self.ray is not None:
-            repr += [f"{self.ray.cmd()}"]
-        if self.isoline is not None:
-            repr += [f"{self.isoline.cmd()}"]
-        if self.points is not None:
-            repr += [f"{self.points.cmd()}"]
-        if self.ngrid is not None:
-            repr += [f"{self.ngrid.cmd()}"]
-        if self.quantity is not None:
-            repr += self.quantity.cmd()  # Component renders a list
-        if self.output_options is not None:
-            repr += [f"{self.output_options.cmd()}"]
-        if self.block is not None:
-            repr += [f"{self.block.cmd()}"]
-        if self.table is not None:
-            repr += [f"{self.table.cmd()}"]
-        if self.specout is not None:
-            repr += [f"{self.specout.cmd()}"]
-        if self.nestout is not None:
-            repr += [f"{self.nestout.cmd()}"]
-        if self.test is not None:
-            repr += [f"{self.test.cmd()}"]
+        for field in self._cmd_fields:
+            obj = getattr(self, field)
+            if obj is None:
+                continue
+            cmd = obj.cmd()
+            if isinstance(cmd, list):
+                repr.extend(cmd)  # Component renders a list
+            else:
+                repr.append(cmd)
         return repr
 
 
@@ -747,7 +743,8 @@ class LOCKUP(BaseComponent):
         default="lockup", description="Model type discriminator"
     )
     compute: COMPUTE_TYPES = Field(description="Compute components")
+    _stop: ClassVar[STOP] = STOP()
 
     def cmd(self) -> list:
         """Command file strings for this component."""
-        return self.compute.cmd() + [STOP().render()]
+        return self.compute.cmd() + [self._stop.render()]
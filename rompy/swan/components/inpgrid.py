@@ -1,7 +1,7 @@
 """Input grid for SWAN."""
-from typing import Literal, Union, Annotated, Optional
+from typing import ClassVar, Literal, Optional
 from pathlib import Path
-from pydantic import Field, model_validator
+from pydantic import Field, ValidationInfo, field_validator
 from abc import ABC
 
 from rompy.swan.components.base import BaseComponent
@@ -49,18 +49,39 @@ class INPGRID(BaseComponent, ABC):
     readinp: READINP = Field(
         description="SWAN input grid file reader specification",
     )
-
-    @model_validator(mode="after")
-    def set_nonstat_suffix(self) -> "INPGRID":
+    _cmd_prefix: ClassVar[dict] = {
+        option: f"INPGRID {option.value.upper()}" for option in GridOptions
+    }
+
+    @field_validator("nonstationary")
+    @classmethod
+    def set_nonstat_suffix(
+        cls, nonstationary: Optional[NONSTATIONARY]
+    ) -> Optional[NONSTATIONARY]:
         """Set the nonstationary suffix."""
+        if nonstationary is not None:
+            nonstationary.suffix = "inp"
+        return nonstationary
+
+    @field_validator("readinp")
+    @classmethod
+    def set_readinp_grid_type(cls, readinp: READINP, info: ValidationInfo) -> READINP:
+        """Set the grid type of the reader."""
+        if info.data.get("grid_type") is not None:
+            readinp.grid_type = info.data["grid_type"]
+        return readinp
+
+    def _epilogue(self) -> list:
+        """Optional exception and nonstationary parts closing the INPGRID command."""
+        parts = []
+        if self.excval is not None:
+            parts.append(f"EXCEPTION excval={self.excval}")
         if self.nonstationary is not None:
-            self.nonstationary.suffix = "inp"
-        if self.grid_type is not None:
-            self.readinp.grid_type = self.grid_type
-        return self
+            parts.append(self.nonstationary.render())
+        return parts
 
     def cmd(self) -> str:
-        return f"INPGRID {self.grid_type.upper()}"
+        return self._cmd_prefix[self.grid_type]
 
 
 class REGULAR(INPGRID):
@@ -175,17 +196,18 @@ class REGULAR(INPGRID):
     )
 
     def cmd(self) -> list:
-        repr = (
-            f"{super().cmd()} REGULAR xpinp={self.xpinp} ypinp={self.ypinp} "
-            f"alpinp={self.alpinp} mxinp={self.mxinp} myinp={self.myinp} "
-            f"dxinp={self.dxinp} dyinp={self.dyinp}"
-        )
-        if self.excval is not None:
-            repr += f" EXCEPTION excval={self.excval}"
-        if self.nonstationary is not None:
-            repr += f" {self.nonstationary.render()}"
-        repr = [repr] + [self.readinp.render()]
-        return repr
+        parts = [
+            super().cmd(),
+            "REGULAR",
+            f"xpinp={self.xpinp}",
+            f"ypinp={self.ypinp}",
+            f"alpinp={self.alpinp}",
+            f"mxinp={self.mxinp}",
+            f"myinp={self.myinp}",
+            f"dxinp={self.dxinp}",
+            f"dyinp={self.dyinp}",
+        ]
+        return [" ".join(parts + self._epilogue()), self.readinp.render()]
 
 
 class CURVILINEAR(INPGRID):
@@ -263,17 +285,16 @@ class CURVILINEAR(INPGRID):
         ),
     )
 
-    def cmd(self) -> str:
-        repr = (
-            f"{super().cmd()} CURVILINEAR stagrx={self.stagrx} "
-            f"stagry={self.stagry} mxinp={self.mxinp} myinp={self.myinp} "
-        )
-        if self.excval is not None:
-            repr += f" EXCEPTION excval={self.excval}"
-        if self.nonstationary is not None:
-            repr += f" {self.nonstationary.render()}"
-        repr = [repr] + [self.readinp.render()]
-        return repr
+    def cmd(self) -> list:
+        parts = [
+            super().cmd(),
+            "CURVILINEAR",
+            f"stagrx={self.stagrx}",
+            f"stagry={self.stagry}",
+            f"mxinp={self.mxinp}",
+            f"myinp={self.myinp}",
+        ]
+        return [" ".join(parts + self._epilogue()), self.readinp.render()]
 
 
 class UNSTRUCTURED(INPGRID):
@@ -314,11 +335,6 @@ class UNSTRUCTURED(INPGRID):
         default="unstructured", description="Model type discriminator"
     )
 
-    def cmd(self) -> str:
-        repr = f"{super().cmd()} UNSTRUCTURED"
-        if self.excval is not None:
-            repr += f" EXCEPTION excval={self.excval}"
-        if self.nonstationary is not None:
-            repr += f" {self.nonstationary.render()}"
-        repr = [repr] + [self.readinp.render()]
-        return repr
+    def cmd(self) -> list:
+        parts = [super().cmd(), "UNSTRUCTURED"]
+        return [" ".join(parts + self._epilogue()), self.readinp.render()]
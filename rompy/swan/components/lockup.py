@@ -1,11 +1,9 @@
 """Model lockup components."""
 import logging
 from pathlib import Path
-from typing import Literal, Optional, Union
+from typing import Annotated, Literal, Optional, Union
 from pydantic import field_validator, model_validator, Field
 from datetime import datetime
-from pandas import Timestamp
-from numpy import inf
 
 from rompy.swan.components.base import BaseComponent
 from rompy.swan.subcomponents.time import STATIONARY, NONSTATIONARY
@@ -13,7 +11,9 @@ from rompy.swan.subcomponents.time import STATIONARY, NONSTATIONARY
 
 logger = logging.getLogger(__name__)
 
-TIMES_TYPE = Union[STATIONARY, NONSTATIONARY]
+TIMES_TYPE = Annotated[
+    Union[STATIONARY, NONSTATIONARY], Field(discriminator="model_type")
+]
 HOTTIMES_TYPE = Union[list[datetime], list[int]]
 
 
@@ -92,7 +92,6 @@ class COMPUTE(BaseComponent):
     times: Optional[TIMES_TYPE] = Field(
         default=None,
         description="Times for the stationary or nonstationary computation",
-        discriminator="model_type",
     )
     i0: Optional[int] = Field(
         default=None,
@@ -167,7 +166,7 @@ class HOTFILE(BaseComponent):
     model_type: Literal["hotfile", "HOTFILE"] = Field(
         default="hotfile", description="Model type discriminator"
     )
-    fname: Path = Field(
+    fname: str = Field(
         description="Name of the file to which the wave field is written",
         max_length=36,
     )
@@ -176,6 +175,14 @@ class HOTFILE(BaseComponent):
         description=("Choose between free (SWAN ASCII) or unformatted (binary) format"),
     )
 
+    @field_validator("fname", mode="before")
+    @classmethod
+    def path_to_str(cls, fname: str | Path) -> str:
+        """Allow specifying fname as a Path object and normalise it as a path."""
+        if isinstance(fname, (str, Path)):
+            return str(Path(fname))
+        return fname
+
     def cmd(self) -> str:
         """Command file string for this component."""
         repr = f"HOTFILE fname='{self.fname}'"
@@ -238,7 +245,6 @@ class COMPUTE_STAT(BaseComponent):
     times: TIMES_TYPE = Field(
         default_factory=STATIONARY,
         description="Compute times",
-        discriminator="model_type",
     )
     hotfile: Optional[HOTFILE] = Field(
         default=None,
@@ -257,14 +263,14 @@ class COMPUTE_STAT(BaseComponent):
 
     @field_validator("hottimes")
     @classmethod
-    def timestamp_to_datetime(cls, hottimes: TIMES_TYPE) -> TIMES_TYPE:
+    def timestamp_to_datetime(cls, hottimes: HOTTIMES_TYPE) -> HOTTIMES_TYPE:
         """Ensure pandas.Timestamp entries are coerced into datatime."""
-        if hottimes and isinstance(hottimes[0], Timestamp):
+        if hottimes and hasattr(hottimes[0], "to_pydatetime"):
             hottimes = [t.to_pydatetime() for t in hottimes]
         return hottimes
 
     @model_validator(mode="after")
-    def hotfile_with_hottimes(self) -> "COMPUTE_NONSTAT":
+    def hotfile_with_hottimes(self) -> "COMPUTE_STAT":
         if self.hottimes and self.hotfile is None:
             logger.warning("hotfile not specified, hottimes will be ignored")
         elif self.hotfile is not None and not self.hottimes:
@@ -274,38 +280,48 @@ class COMPUTE_STAT(BaseComponent):
     @property
     def hotids(self) -> list:
         """List time ids at which to write hotfiles."""
+        return self._hotids(self.times())
+
+    def _hotids(self, times: list[datetime]) -> list:
+        """Hotfile time ids from the list of times already generated."""
         if self.hottimes and isinstance(self.hottimes[0], datetime):
+            indices = {t: i for i, t in enumerate(times)}
             ids = []
             for t in self.hottimes:
                 try:
-                    ids.append(self.times().index(t))
-                except ValueError as e:
+                    ids.append(indices[t])
+                except KeyError as e:
                     raise ValueError(f"hottime {t} not in times {self.times}") from e
         else:
-            ids = [i if i >= 0 else i + len(self.times) for i in self.hottimes]
+            ntimes = len(times)
+            ids = [i if i >= 0 else i + ntimes for i in self.hottimes]
             for i in ids:
-                if i >= len(self.times):
+                if i >= ntimes:
                     raise ValueError(
                         f"Hotfile requested for time {i} but times have "
-                        f"only {len(self.times)} values: {self.times} "
+                        f"only {ntimes} values: {self.times} "
                     )
         return ids
 
     def _hotfile(self, time):
         """Set timestamp to hotfile fname."""
-        timestamp = time.strftime(self.suffix)
-        fname = self.hotfile.fname.parent / (
-            f"{self.hotfile.fname.stem}{timestamp}" f"{self.hotfile.fname.suffix}"
-        )
-        return HOTFILE(fname=fname, format=self.hotfile.format)
+        fname = Path(self.hotfile.fname)
+        fname = fname.with_stem(f"{fname.stem}{time.strftime(self.suffix)}")
+        # Validated so the max length of the timestamped fname is checked
+        return HOTFILE(fname=str(fname), format=self.hotfile.format)
 
     def cmd(self) -> list:
         """Command file string for this component."""
         repr = []
-        for ind, time in enumerate(self.times()):
-            repr += [f"COMPUTE {STATIONARY(time=time, tfmt=self.times.tfmt).render()}"]
-            if ind in self.hotids and self.hotfile is not None:
-                repr += [f"{self._hotfile(time).render()}"]
+        times = self.times()
+        hotids = set(self._hotids(times)) if self.hotfile is not None else set()
+        tfmt = self.times.tfmt
+        for ind, time in enumerate(times):
+            # times are already validated so the model can be constructed directly
+            stat = STATIONARY.model_construct(time=time, tfmt=tfmt)
+            repr.append(f"COMPUTE {stat.render()}")
+            if ind in hotids:
+                repr.append(self._hotfile(time).render())
         return repr
 
 
@@ -382,32 +398,29 @@ class COMPUTE_NONSTAT(COMPUTE_STAT):
         return times
 
     def _times(self, tbeg, tend):
-        return NONSTATIONARY(
-            tbeg=tbeg,
-            tend=tend,
-            delt=self.times.delt,
-            tfmt=self.times.tfmt,
-            dfmt=self.times.dfmt,
-            suffix=self.times.suffix,
-        )
+        """Copy of times over a subperiod, tbeg and tend come from validated times."""
+        return self.times.model_copy(update={"tbeg": tbeg, "tend": tend})
 
     def cmd(self) -> list:
         """Command file string for this component."""
         repr = []
-        ind = -inf
+        ind = -1
         tbeg = self.times.tbeg
         if self.initstat:
-            repr += [f"COMPUTE {STATIONARY(time=tbeg, tfmt=self.times.tfmt).render()}"]
-        for ind in self.hotids:
-            tend = self.times()[ind]
+            stat = STATIONARY.model_construct(time=tbeg, tfmt=self.times.tfmt)
+            repr.append(f"COMPUTE {stat.render()}")
+        times_list = self.times()
+        # Computations must be consecutive so visit each hotfile time once in order
+        for ind in sorted(set(self._hotids(times_list))):
+            tend = times_list[ind]
             times = self._times(tbeg, tend)
-            repr += [f"COMPUTE {times.render()}"]
+            repr.append(f"COMPUTE {times.render()}")
             if self.hotfile is not None:
-                repr += [f"{self._hotfile(tend).render()}"]
+                repr.append(self._hotfile(tend).render())
             tbeg = tend
-        if ind < len(self.times) - 1:
+        if ind < len(times_list) - 1:
             times = self._times(tbeg, self.times.tend)
-            repr += [f"COMPUTE {times.render()}"]
+            repr.append(f"COMPUTE {times.render()}")
         return repr
 
 
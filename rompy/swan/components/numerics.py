@@ -1,6 +1,6 @@
 """Model numerics components."""
 import logging
-from typing import Literal, Optional, Union, Annotated
+from typing import Annotated, ClassVar, Literal, Optional, Union
 from pydantic import Field
 
 from rompy.swan.components.base import BaseComponent
@@ -24,6 +24,10 @@ PROP_TYPE = Annotated[
     Union[BSBT, GSE],
     Field(description="Propagation scheme", discriminator="model_type"),
 ]
+STOP_TYPE = Annotated[
+    Union[STOPC, ACCUR],
+    Field(description="Iteration termination criteria", discriminator="model_type"),
+]
 
 
 class PROP(BaseComponent):
@@ -130,10 +134,9 @@ class NUMERIC(BaseComponent):
     model_type: Literal["numeric", "NUMERIC"] = Field(
         default="numeric", description="Model type discriminator"
     )
-    stop: Optional[Union[STOPC, ACCUR]] = Field(
+    stop: Optional[STOP_TYPE] = Field(
         default=None,
         description="Iteration termination criteria",
-        discriminator="model_type",
     )
     dirimpl: Optional[DIRIMPL] = Field(
         default=None,
@@ -155,16 +158,20 @@ class NUMERIC(BaseComponent):
         default=None,
         description="Stop criteria in the computation of wave setup",
     )
+    _cmd_fields: ClassVar[tuple] = (
+        "stop",
+        "dirimpl",
+        "sigimpl",
+        "ctheta",
+        "csigma",
+        "setup",
+    )
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = "NUMERIC"
-        if self.stop is not None:
-            repr += f" {self.stop.render()}"
-        if self.dirimpl is not None:
-            repr += f" {self.dirimpl.render()}"
-        if self.sigimpl is not None:
-            repr += f" {self.sigimpl.render()}"
-        if self.ctheta is not None:
-            repr += f" {self.ctheta.render()}"
-        return repr
+        repr = ["NUMERIC"]
+        for field in self._cmd_fields:
+            obj = getattr(self, field)
+            if obj is not None:
+                repr.append(obj.render())
+        return " ".join(repr)
@@ -274,10 +274,10 @@ class CURVE(BaseLocation):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = f"{super().cmd()} xp1={self.xp1} yp1={self.yp1}"
+        repr = [f"{super().cmd()} xp1={self.xp1} yp1={self.yp1}"]
         for npts, xp, yp in zip(self.npts, self.xp, self.yp):
-            repr += f"\nint={npts} xp={xp} yp={yp}"
-        return repr
+            repr.append(f"int={npts} xp={xp} yp={yp}")
+        return "\n".join(repr)
 
 
 class CURVES(BaseComponent):
@@ -319,10 +319,7 @@ class CURVES(BaseComponent):
         return [curve.sname for curve in self.curves]
 
     def cmd(self) -> list[str]:
-        repr = []
-        for curve in self.curves:
-            repr += [curve.cmd()]
-        return repr
+        return [curve.cmd() for curve in self.curves]
 
 
 class RAY(BaseComponent):
@@ -459,11 +456,13 @@ class RAY(BaseComponent):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = f"RAY rname='{self.rname}'"
-        repr += f" xp1={self.xp1} yp1={self.yp1} xq1={self.xq1} yq1={self.yq1}"
+        repr = [
+            f"RAY rname='{self.rname}' "
+            f"xp1={self.xp1} yp1={self.yp1} xq1={self.xq1} yq1={self.yq1}"
+        ]
         for npts, xp, yp, xq, yq in zip(self.npts, self.xp, self.yp, self.xq, self.yq):
-            repr += f"\nint={npts} xp={xp} yp={yp} xq={xq} yq={yq}"
-        return repr
+            repr.append(f"int={npts} xp={xp} yp={yp} xq={xq} yq={yq}")
+        return "\n".join(repr)
 
 
 class ISOLINE(BaseLocation):
@@ -570,10 +569,10 @@ class POINTS(BaseLocation):
 
     def cmd(self) -> str:
         """Command file string for this component."""
-        repr = f"{super().cmd()}"
+        repr = [super().cmd()]
         for xp, yp in zip(self.xp, self.yp):
-            repr += f"\nxp={xp} yp={yp}"
-        return repr
+            repr.append(f"xp={xp} yp={yp}")
+        return "\n".join(repr)
 
 
 class POINTS_FILE(BaseLocation):
@@ -1008,8 +1007,8 @@ class OUTPUT_OPTIONS(BaseComponent):
 
     """
 
-    model_type: Literal["block", "BLOCK"] = Field(
-        default="block", description="Model type discriminator"
+    model_type: Literal["output_options", "OUTPUT_OPTIONS"] = Field(
+        default="output_options", description="Model type discriminator"
     )
     comment: Optional[str] = Field(
         default=None,
@@ -1,12 +1,12 @@
 import logging
 import os
 from pathlib import Path
-from typing import Optional, Union
+from typing import Optional
 
 import numpy as np
 import pandas as pd
 import xarray as xr
-from pydantic import field_validator, Field, model_validator
+from pydantic import Field, model_validator
 
 from rompy.core import DataGrid
 from rompy.core.time import TimeRange
@@ -1,6 +1,6 @@
 """Legacy objects in SwanConfig."""
 import logging
-from typing import Union, Annotated, Optional, Literal
+from typing import Optional
 from pathlib import Path
 from pydantic import Field, field_validator
 
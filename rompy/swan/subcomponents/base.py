@@ -1,5 +1,5 @@
 """Base class for SWAN sub-components."""
-from typing import Literal, Optional
+from typing import Literal
 from abc import ABC
 from pydantic import ConfigDict, Field, model_validator
 
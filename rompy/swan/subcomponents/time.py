@@ -1,8 +1,8 @@
 """Time subcomponents."""
 import logging
 from datetime import datetime, timedelta
-from typing import Literal, Optional, Union
-from pydantic import Field, field_validator, model_validator
+from typing import Literal, Union
+from pydantic import Field
 import pandas as pd
 
 from rompy.swan.subcomponents.base import BaseSubComponent
@@ -21,6 +21,17 @@ TIME_FORMAT = {
     5: "%y/%m/%d %H:%M:%S'",
     6: "%y%m%d%H%M",
 }
+DELT_SCALING = {"sec": 1, "min": 60, "hr": 3600, "day": 86400}
+
+
+def format_time(time: datetime, tfmt: int | str) -> str:
+    """Render a time in the SWAN format `tfmt` (a TIME_FORMAT key or a template)."""
+    return time.strftime(TIME_FORMAT.get(tfmt, tfmt))
+
+
+def format_delt(delt: timedelta, dfmt: str) -> str:
+    """Render a time interval in the SWAN unit `dfmt`."""
+    return f"{delt.total_seconds() / DELT_SCALING[dfmt]} {dfmt.upper()}"
 
 
 class Time(BaseSubComponent):
@@ -70,20 +81,11 @@ class Time(BaseSubComponent):
     tfmt: Union[Literal[1, 2, 3, 4, 5, 6], str] = Field(
         default=1,
         description="Format to render time specification",
-        validate_default=True,
     )
 
-    @field_validator("tfmt")
-    @classmethod
-    def set_time_format(cls, v: int | str) -> str:
-        """Set the time format to render."""
-        if isinstance(v, str):
-            return v
-        return TIME_FORMAT[v]
-
     def cmd(self) -> str:
         """Render subcomponent cmd."""
-        return f"{self.time.strftime(self.tfmt)}"
+        return format_time(self.time, self.tfmt)
 
 
 class Delt(BaseSubComponent):
@@ -130,12 +132,11 @@ class Delt(BaseSubComponent):
 
     @property
     def delt_float(self):
-        delt_scaling = {"sec": 1, "min": 60, "hr": 3600, "day": 86400}
-        return self.delt.total_seconds() / delt_scaling[self.dfmt]
+        return self.delt.total_seconds() / DELT_SCALING[self.dfmt]
 
     def cmd(self) -> str:
         """Render subcomponent cmd."""
-        return f"{self.delt_float} {self.dfmt.upper()}"
+        return format_delt(self.delt, self.dfmt)
 
 
 class TimeRangeOpen(BaseSubComponent):
@@ -218,8 +219,8 @@ class TimeRangeOpen(BaseSubComponent):
 
     def cmd(self) -> str:
         """Render subcomponent cmd."""
-        repr = f"tbeg{self.suffix}={Time(time=self.tbeg, tfmt=self.tfmt).render()}"
-        repr += f" delt{self.suffix}={Delt(delt=self.delt, dfmt=self.dfmt).render()}"
+        repr = f"tbeg{self.suffix}={format_time(self.tbeg, self.tfmt)}"
+        repr += f" delt{self.suffix}={format_delt(self.delt, self.dfmt)}"
         return repr
 
 
@@ -283,7 +284,7 @@ class TimeRangeClosed(TimeRangeOpen):
     def cmd(self) -> str:
         """Render subcomponent cmd."""
         repr = super().cmd()
-        repr += f" tend{self.suffix}={Time(time=self.tend, tfmt=self.tfmt).render()}"
+        repr += f" tend{self.suffix}={format_time(self.tend, self.tfmt)}"
         return repr
 
 
@@ -386,4 +387,4 @@ class STATIONARY(BaseSubComponent):
 
     def cmd(self) -> str:
         """Render subcomponent cmd."""
-        return f"STATIONARY time={Time(time=self.time, tfmt=self.tfmt).render()}"
+        return f"STATIONARY time={format_time(self.time, self.tfmt)}"
@@ -1,6 +1,7 @@
 """Test lockup components."""
 import pytest
 from copy import deepcopy
+from pathlib import Path
 from pydantic import ValidationError
 
 from rompy.swan.subcomponents.time import STATIONARY, NONSTATIONARY
@@ -82,6 +83,12 @@ def test_compute_nonstationary_multiple_with_hotfiles(times):
     assert cmds[6].startswith("COMPUTE NONSTATIONARY tbegc=19900101.180000")
 
 
+def test_compute_nonstationary_unsorted_hottimes(times):
+    kwargs = dict(times=times, hotfile={"fname": "hotfile"})
+    compute = COMPUTE_NONSTAT(hottimes=[12, 6, 12], **kwargs)
+    assert compute.render() == COMPUTE_NONSTAT(hottimes=[6, 12], **kwargs).render()
+
+
 def test_compute_nonstationary_initstat(times):
     compute = COMPUTE_NONSTAT(times=times, initstat=True)
     cmds = compute.render().split("\n")
@@ -153,3 +160,15 @@ def test_compute_stationary_no_times_passed():
 def test_compute_nonstationary_no_times_passed():
     compute = COMPUTE_NONSTAT()
     assert compute.render() == f"COMPUTE {compute.times.render()}"
+
+
+def test_hotfile_fname_normalised():
+    assert HOTFILE(fname="./hot.swn").render() == "HOTFILE fname='hot.swn'"
+    assert HOTFILE(fname="out//hot.swn").render() == "HOTFILE fname='out/hot.swn'"
+    assert HOTFILE(fname=Path("out/hot.swn")) == HOTFILE(fname="./out//hot.swn")
+
+
+def test_hotfile_fname_max_length():
+    HOTFILE(fname=Path("a" * 36))
+    with pytest.raises(ValidationError):
+        HOTFILE(fname="a" * 37)
@@ -0,0 +1,33 @@
+"""Test numerics components."""
+from rompy.swan.components.numerics import PROP, NUMERIC
+
+
+def test_prop_default():
+    prop = PROP()
+    assert prop.render() == "PROP"
+
+
+def test_prop_bsbt():
+    prop = PROP(scheme=dict(model_type="bsbt"))
+    assert prop.render() == "PROP BSBT"
+
+
+def test_numeric_default():
+    numeric = NUMERIC()
+    assert numeric.render() == "NUMERIC"
+
+
+def test_numeric_renders_all_subcomponents():
+    numeric = NUMERIC(
+        stop=dict(model_type="stopc", dabs=0.05, drel=0.01, curvat=0.05, npnts=99.5),
+        dirimpl=dict(cdd=0.5),
+        sigimpl=dict(css=0.5, eps2=1e-4, outp=0, niter=20),
+        ctheta=dict(cfl=0.9),
+        csigma=dict(cfl=0.9),
+        setup=dict(eps2=1e-4, outp=0, niter=20),
+    )
+    assert numeric.render() == (
+        "NUMERIC STOPC dabs=0.05 drel=0.01 curvat=0.05 npnts=99.5 DIRIMPL cdd=0.5 "
+        "SIGIMPL css=0.5 eps2=0.0001 outp=0 niter=20 CTHETA cfl=0.9 CSIGMA cfl=0.9 "
+        "SETUP eps2=0.0001 outp=0 niter=20"
+    )
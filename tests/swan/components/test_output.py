@@ -264,6 +264,12 @@ def test_output_options(output_options):
     )
 
 
+def test_output_options_model_type_distinct_from_block(output_options):
+    assert output_options.model_type == "output_options"
+    with pytest.raises(ValidationError):
+        OUTPUT_OPTIONS(model_type="block")
+
+
 def test_block():
     block = BLOCK(sname="outgrid", fname="./depth-frame.nc", output=["depth"])
     block.render() == "BLOCK sname='outgrid' fname='./depth-frame.nc' DEPTH"
@@ -9,6 +9,8 @@ from rompy.swan.subcomponents.time import (
     TimeRangeClosed,
     STATIONARY,
     NONSTATIONARY,
+    format_time,
+    format_delt,
 )
 
 
@@ -74,3 +76,25 @@ def test_nonstationary():
 def test_stationary():
     stat = STATIONARY(time="2023-01-01T00:00:00", tfmt=1)
     assert stat.render() == "STATIONARY time=20230101.000000"
+
+
+def test_render_updated_on_setattr():
+    tr = NONSTATIONARY(tbeg="2023-01-01T00:00:00", tend="2023-01-02T00:00:00")
+    assert tr.render() == tr.render()
+    tr.suffix = "inp"
+    assert tr.render() == (
+        "NONSTATIONARY tbeginp=20230101.000000 deltinp=3600.0 SEC "
+        "tendinp=20230102.000000"
+    )
+    assert tr.model_copy(update={"suffix": ""}).render().startswith(
+        "NONSTATIONARY tbeg="
+    )
+
+
+def test_format_helpers_match_subcomponents():
+    t = datetime(1990, 1, 1, 12, 30, 0)
+    for tfmt in [1, 2, 3, 4, 5, 6, "%Y-%m-%d"]:
+        assert format_time(t, tfmt) == Time(time=t, tfmt=tfmt).render()
+    for dfmt in ["sec", "min", "hr", "day"]:
+        delt = timedelta(hours=6)
+        assert format_delt(delt, dfmt) == Delt(delt=delt, dfmt=dfmt).render()
@@ -0,0 +1,20 @@
+"""Test the lazy exports of the swan packages."""
+import rompy.swan
+import rompy.swan.components
+
+
+def test_swan_exports():
+    assert set(rompy.swan.__all__) <= set(dir(rompy.swan))
+    assert "__getattr__" in dir(rompy.swan)
+    namespace = {}
+    exec("from rompy.swan import *", namespace)
+    for name in rompy.swan.__all__:
+        assert namespace[name] is getattr(rompy.swan, name)
+
+
+def test_swan_components_exports():
+    assert set(rompy.swan.components.__all__) <= set(dir(rompy.swan.components))
+    assert "__getattr__" in dir(rompy.swan.components)
+    namespace = {}
+    exec("from rompy.swan.components import *", namespace)
+    assert {"cgrid", "inpgrid"} == set(namespace) - {"__builtins__"}